@@ -1,13 +1,16 @@
 import time
 import logging
-from datetime import datetime
-from typing import Dict, Any
+import signal
+import sys
+import threading
+from typing import Dict, Any, List, Tuple
 from .config import Config
 from .models.restaurant import Restaurant
 from .services.bluesky_service import BlueskyService
 from .services.chicago_data_service import ChicagoDataService
 from .utils.time_utils import TimestampManager
-from .utils.logging_config import setup_logging
+from .utils.seen_cache import SeenLicenseCache
+from .utils.logging_config import setup_logging, flush_logs
 
 try:
     import prometheus_client as prom
@@ -19,6 +22,10 @@ except ImportError:
 class ChicagoRestaurantBot:
     """Bot that posts new Chicago restaurant openings to Bluesky."""
     
+    # The metrics server is process-wide, so only start it once
+    _server_lock = threading.Lock()
+    _server_started = False
+    
     def __init__(self, config: Config):
         """
         Initialize the bot with configuration.
@@ -30,7 +37,7 @@ class ChicagoRestaurantBot:
         
         # Set up logging
         setup_logging(
-            level=config.get_log_level(),
+            level=config.log_level,
             log_file=config.log_file
         )
         self.logger = logging.getLogger(__name__)
@@ -38,11 +45,27 @@ class ChicagoRestaurantBot:
         # Initialize services
         self.bluesky = BlueskyService(config)
         self.chicago_data = ChicagoDataService(
-            config.chicago_data_token
+            config.chicago_data_token,
+            filters=config.filter_sets
         )
         self.timestamp_mgr = TimestampManager(
             config.timestamp_file
         )
+        self.seen_licenses = SeenLicenseCache(
+            f"{config.timestamp_file}.seen"
+        )
+        
+        # Polls each license has failed to post in, so a record the server
+        # keeps rejecting can be given up on instead of blocking progress
+        self.failed_polls: Dict[str, int] = {}
+        self.max_failed_polls = (config.error_handling or {}).get(
+            'max_failed_polls', 3
+        )
+        
+        # Restore cache validators so the first poll can be conditional
+        validators = self.timestamp_mgr.load_validators()
+        self.chicago_data.etag = validators['etag']
+        self.chicago_data.last_modified = validators['last_modified']
         
         # Set up metrics if enabled
         self.metrics = self._setup_metrics() if (
@@ -70,12 +93,23 @@ class ChicagoRestaurantBot:
             )
         }
         
-        # Start metrics server
-        prom.start_http_server(
-            self.config.monitoring.get('metrics_port', 9090)
-        )
-        
         return metrics
+    
+    def _ensure_metrics_server(self) -> None:
+        """
+        Start the metrics server if it is not already running.
+        
+        Only the long-running loop exposes metrics, so one-shot callers of
+        process_new_restaurants never bind the port.
+        """
+        if ChicagoRestaurantBot._server_started:
+            return
+        with ChicagoRestaurantBot._server_lock:
+            if not ChicagoRestaurantBot._server_started:
+                prom.start_http_server(
+                    self.config.monitoring.get('metrics_port', 9090)
+                )
+                ChicagoRestaurantBot._server_started = True
         
     def process_new_restaurants(self) -> int:
         """
@@ -91,24 +125,83 @@ class ChicagoRestaurantBot:
         start_time = time.time()
         
         try:
-            # Fetch new restaurants
-            restaurants = self.chicago_data.get_new_restaurants(last_check)
+            # Stream new restaurants, posting once every worker has a full batch
+            flush_size = self.bluesky.max_batch_size * self.bluesky.post_workers
+            restaurants_found = 0
+            successful_posts = 0
+            failed_posts = 0
+            abandoned_posts = 0
+            latest_application = last_check
+            pending = []
+            
+            # Re-read the last checked day only once the seen cache can tell
+            # which of its rows were already posted; a missing cache (e.g.
+            # right after an upgrade) would post them again
+            restaurants = self.chicago_data.iter_new_restaurants(
+                last_check,
+                inclusive=self.seen_licenses.persisted
+            )
+            for restaurant in restaurants:
+                restaurants_found += 1
+                latest_application = max(
+                    latest_application, restaurant.application_date
+                )
+                
+                # Skip licenses that were already announced
+                if restaurant.dedup_key in self.seen_licenses:
+                    continue
+                
+                pending.append(restaurant)
+                if len(pending) >= flush_size:
+                    posted, failed, abandoned = self._post_batch(pending)
+                    successful_posts += posted
+                    failed_posts += failed
+                    abandoned_posts += abandoned
+                    pending = []
+            
+            if pending:
+                posted, failed, abandoned = self._post_batch(pending)
+                successful_posts += posted
+                failed_posts += failed
+                abandoned_posts += abandoned
+            
+            if successful_posts or abandoned_posts:
+                self.seen_licenses.save()
+            
+            # Nothing changed upstream
+            if self.chicago_data.last_status_code == 304:
+                return 0
+            
+            # The fetch failed part way; keep the timestamp and drop the
+            # validators so the next poll fetches everything again
+            if (
+                self.chicago_data.last_status_code != 200
+                or not self.chicago_data.last_fetch_complete
+            ):
+                self._discard_validators()
+                return successful_posts
             
             if self.metrics:
-                self.metrics['restaurants_found'].inc(len(restaurants))
+                self.metrics['restaurants_found'].inc(restaurants_found)
             
-            # Post each restaurant
-            successful_posts = 0
-            for restaurant in restaurants:
-                if self.bluesky.post_restaurant(restaurant):
-                    successful_posts += 1
-                    if self.metrics:
-                        self.metrics['posts_succeeded'].inc()
-                elif self.metrics:
-                    self.metrics['posts_failed'].inc()
+            # Keep the timestamp and validators if any post failed, so the
+            # next poll fetches the same rows again instead of getting a 304
+            if failed_posts:
+                self._discard_validators()
+                return successful_posts
             
-            # Update timestamp after successful processing
-            self.timestamp_mgr.save_timestamp(datetime.now())
+            self.timestamp_mgr.save_validators(
+                self.chicago_data.etag,
+                self.chicago_data.last_modified
+            )
+            
+            if not restaurants_found:
+                return 0
+            
+            # Advance to the newest application seen, not the wall clock, so
+            # records that show up late with an earlier date are not missed
+            if successful_posts or abandoned_posts:
+                self.timestamp_mgr.save_timestamp(latest_application)
             
             # Record processing time if metrics enabled
             if self.metrics:
@@ -124,6 +217,68 @@ class ChicagoRestaurantBot:
                 self.metrics['posts_failed'].inc()
             return 0
     
+    def _discard_validators(self) -> None:
+        """Forget cached validators so the next fetch is unconditional."""
+        self.chicago_data.etag = None
+        self.chicago_data.last_modified = None
+    
+    def _post_batch(self, restaurants: List[Restaurant]) -> Tuple[int, int, int]:
+        """
+        Post a batch of restaurants and record the results.
+        
+        A restaurant whose post has failed in max_failed_polls polls is
+        given up on and marked as seen, so it is not retried again.
+        
+        Args:
+            restaurants: Restaurant objects to post about
+            
+        Returns:
+            Tuple of the number of restaurants posted, the number whose post
+            failed and will be retried, and the number given up on
+        """
+        posted, failed = self.bluesky.post_restaurants(restaurants)
+        for restaurant in posted:
+            self.seen_licenses.add(restaurant.dedup_key)
+            self.failed_polls.pop(restaurant.dedup_key, None)
+        
+        abandoned = 0
+        for restaurant in failed:
+            key = restaurant.dedup_key
+            attempts = self.failed_polls.get(key, 0) + 1
+            if attempts >= self.max_failed_polls:
+                self.logger.error(
+                    f"Giving up on {restaurant.name} ({key}) after "
+                    f"{attempts} failed polls"
+                )
+                self.seen_licenses.add(key)
+                self.failed_polls.pop(key, None)
+                abandoned += 1
+            else:
+                self.failed_polls[key] = attempts
+        
+        if self.metrics:
+            self.metrics['posts_succeeded'].inc(len(posted))
+            self.metrics['posts_failed'].inc(len(failed))
+        
+        return len(posted), len(failed) - abandoned, abandoned
+    
+    def _next_interval_minutes(self) -> int:
+        """
+        Choose how long to sleep before the next check.
+        
+        Backs off to the regular interval only while the dataset is
+        unchanged (a 304). New data or a failed fetch checks again sooner.
+        
+        Returns:
+            Number of minutes to sleep
+        """
+        if self.chicago_data.last_status_code == 304:
+            return self.config.check_interval_minutes
+        return min(
+            self.config.active_check_interval_minutes,
+            self.config.check_interval_minutes
+        )
+    
     def run(self):
         """Run the bot continuously."""
         self.logger.info(
@@ -131,9 +286,12 @@ class ChicagoRestaurantBot:
             f"(checking every {self.config.check_interval_minutes} minutes)"
         )
         
+        # Start the metrics server before polling so a port that is
+        # already in use stops the bot instead of failing every poll
         if self.metrics:
+            self._ensure_metrics_server()
             self.logger.info(
-                f"Metrics server running on port "
+                f"Metrics server listening on port "
                 f"{self.config.monitoring.get('metrics_port', 9090)}"
             )
         
@@ -141,14 +299,18 @@ class ChicagoRestaurantBot:
             try:
                 # Process new restaurants
                 processed = self.process_new_restaurants()
+                interval = self._next_interval_minutes()
                 
                 self.logger.info(
                     f"Processed {processed} new restaurants. "
-                    f"Sleeping for {self.config.check_interval_minutes} minutes."
+                    f"Sleeping for {interval} minutes."
                 )
                 
+                # Write the buffered log file before the long sleep
+                flush_logs()
+                
                 # Sleep until next check
-                time.sleep(self.config.check_interval_minutes * 60)
+                time.sleep(interval * 60)
                 
             except Exception as e:
                 self.logger.error(f"Error in main loop: {e}")
@@ -158,6 +320,10 @@ class ChicagoRestaurantBot:
 
 def main():
     """Entry point for the bot."""
+    # Exit normally on SIGTERM (docker stop, systemctl stop) so atexit
+    # handlers run and buffered log records are written
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
     try:
         # Load configuration from environment and YAML
         config = Config.from_env()
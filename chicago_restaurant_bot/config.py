@@ -1,10 +1,44 @@
 import os
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Optional, List, Dict, Any, FrozenSet
 import yaml
 import logging
 
 
+# YAML locations of each feature flag, as dotted paths
+_FEATURE_FLAG_KEYS = {
+    'include_ward': 'features.announcement.include_ward',
+    'include_square_footage': 'features.announcement.include_square_footage',
+    'include_business_activity': 'features.announcement.include_business_activity',
+    'use_emojis': 'features.formatting.use_emojis',
+    'add_hashtags': 'features.formatting.add_hashtags',
+    'auto_retry': 'features.error_handling.auto_retry',
+    'enable_metrics': 'monitoring.enable_metrics',
+}
+
+
+def _flatten(config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Flatten nested YAML mappings into dotted keys.
+    
+    Args:
+        config: Nested configuration dictionary
+        prefix: Key prefix for the current nesting level
+        
+    Returns:
+        Dictionary mapping keys like 'features.formatting.use_emojis' to values
+    """
+    flat = {}
+    for key, value in (config or {}).items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+        else:
+            flat[path] = value
+    return flat
+
+
 @dataclass
 class FeatureFlags:
     """Feature flags configuration."""
@@ -26,16 +60,64 @@ class Config:
     chicago_data_token: Optional[str]
     
     # Basic settings
-    check_interval_minutes: int = 60
+    check_interval_minutes: int = 360
+    active_check_interval_minutes: int = 60
     timestamp_file: str = "last_check.txt"
     log_file: Optional[str] = None
     
     # Feature flags and dynamic config
-    features: FeatureFlags = FeatureFlags()
+    features: FeatureFlags = field(default_factory=FeatureFlags)
     hashtags: List[str] = None
     post_template: Dict[str, str] = None
     filters: Dict[str, List[str]] = None
     monitoring: Dict[str, Any] = None
+    throttling: Dict[str, Any] = None
+    error_handling: Dict[str, Any] = None
+    
+    # Filter lists as sets for constant-time membership checks
+    filter_sets: Dict[str, FrozenSet[str]] = field(init=False, repr=False)
+    
+    # Announcement pieces resolved against the feature flags
+    template_prefixes: Dict[str, Optional[str]] = field(init=False, repr=False)
+    hashtag_suffix: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Precompute derived settings."""
+        template = self.post_template or {}
+        features = self.features
+        
+        def prefix(key: str, default: str, enabled: bool = True) -> Optional[str]:
+            # None marks a section that is disabled entirely
+            if not enabled:
+                return None
+            return template.get(key, default) if features.use_emojis else ""
+        
+        self.template_prefixes = {
+            'header': template.get('header', "🆕 New Restaurant Alert!\n"),
+            'name': prefix('name_prefix', "🍽️"),
+            'address': prefix('address_prefix', "📍"),
+            'activity': prefix(
+                'activity_prefix', "🍳", features.include_business_activity
+            ),
+            'square_footage': prefix(
+                'square_footage_prefix', "📐", features.include_square_footage
+            ),
+            'ward': prefix('ward_prefix', "📍", features.include_ward),
+        }
+        self.hashtag_suffix = (
+            "\n\n" + " ".join(f"#{tag}" for tag in self.hashtags)
+            if features.add_hashtags and self.hashtags else ""
+        )
+        
+        filters = self.filters or {}
+        self.filter_sets = {
+            key: frozenset(filters.get(key) or [])
+            for key in (
+                'included_zip_codes',
+                'included_wards',
+                'excluded_license_types'
+            )
+        }
     
     @classmethod
     def load_yaml_config(cls, config_path: str = "config.yaml") -> Dict[str, Any]:
@@ -59,7 +141,9 @@ class Config:
             
         Optional env vars:
             CHICAGO_DATA_TOKEN: Chicago Data Portal API token
-            CHECK_INTERVAL_MINUTES: Minutes between checks (default: 60)
+            CHECK_INTERVAL_MINUTES: Minutes between checks (default: 360)
+            ACTIVE_CHECK_INTERVAL_MINUTES: Minutes between checks after
+                new data was seen or a fetch failed (default: 60)
             TIMESTAMP_FILE: Path to timestamp file (default: last_check.txt)
             LOG_FILE: Path to log file (default: None, logs to console only)
             CONFIG_PATH: Path to YAML config file (default: config.yaml)
@@ -67,9 +151,11 @@ class Config:
         Returns:
             Config object
         """
+        env = os.environ
+        
         # Load YAML config first
         yaml_config = cls.load_yaml_config(
-            os.getenv('CONFIG_PATH', config_path)
+            env.get('CONFIG_PATH', config_path)
         )
         
         # Check required environment variables
@@ -78,9 +164,10 @@ class Config:
             'BLUESKY_PASSWORD': 'Bluesky password',
         }
         
+        credentials = {var: env.get(var) for var in required_vars}
         missing_vars = [
-            var for var in required_vars 
-            if not os.getenv(var)
+            var for var, value in credentials.items()
+            if not value
         ]
         
         if missing_vars:
@@ -93,30 +180,29 @@ class Config:
                 ", ".join(missing_desc)
             )
         
-        # Create feature flags from YAML config
-        features_config = yaml_config.get('features', {})
-        features = FeatureFlags(
-            include_ward=features_config.get('announcement', {}).get('include_ward', True),
-            include_square_footage=features_config.get('announcement', {}).get('include_square_footage', True),
-            include_business_activity=features_config.get('announcement', {}).get('include_business_activity', True),
-            use_emojis=features_config.get('formatting', {}).get('use_emojis', True),
-            add_hashtags=features_config.get('formatting', {}).get('add_hashtags', True),
-            auto_retry=features_config.get('error_handling', {}).get('auto_retry', True),
-            enable_metrics=yaml_config.get('monitoring', {}).get('enable_metrics', False)
-        )
+        # Create feature flags from YAML config, falling back to defaults
+        flat_config = _flatten(yaml_config)
+        features = FeatureFlags(**{
+            name: flat_config[key]
+            for name, key in _FEATURE_FLAG_KEYS.items()
+            if key in flat_config
+        })
         
         # Create config object with environment variables taking precedence
         return cls(
-            bluesky_handle=os.getenv('BLUESKY_HANDLE'),
-            bluesky_password=os.getenv('BLUESKY_PASSWORD'),
-            chicago_data_token=os.getenv('CHICAGO_DATA_TOKEN'),
+            bluesky_handle=credentials['BLUESKY_HANDLE'],
+            bluesky_password=credentials['BLUESKY_PASSWORD'],
+            chicago_data_token=env.get('CHICAGO_DATA_TOKEN'),
             check_interval_minutes=int(
-                os.getenv('CHECK_INTERVAL_MINUTES', '60')
+                env.get('CHECK_INTERVAL_MINUTES', '360')
+            ),
+            active_check_interval_minutes=int(
+                env.get('ACTIVE_CHECK_INTERVAL_MINUTES', '60')
             ),
-            timestamp_file=os.getenv(
+            timestamp_file=env.get(
                 'TIMESTAMP_FILE', 'last_check.txt'
             ),
-            log_file=os.getenv('LOG_FILE'),
+            log_file=env.get('LOG_FILE'),
             features=features,
             hashtags=(
                 yaml_config.get('hashtags', {}).get('default', []) +
@@ -124,11 +210,14 @@ class Config:
             ),
             post_template=yaml_config.get('post_template', {}),
             filters=yaml_config.get('filters', {}),
-            monitoring=yaml_config.get('monitoring', {})
+            monitoring=yaml_config.get('monitoring', {}),
+            throttling=yaml_config.get('features', {}).get('throttling', {}),
+            error_handling=yaml_config.get('features', {}).get('error_handling', {})
         )
 
-    def get_log_level(self) -> int:
-        """Get logging level from config."""
+    @cached_property
+    def log_level(self) -> int:
+        """Logging level from config, resolved on first access."""
         level_map = {
             'DEBUG': logging.DEBUG,
             'INFO': logging.INFO,
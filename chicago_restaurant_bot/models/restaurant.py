@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, FrozenSet
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Restaurant:
     """Represents a restaurant from the Chicago Data Portal."""
     name: str
@@ -14,6 +14,14 @@ class Restaurant:
     square_footage: Optional[str]
     application_date: datetime
     ward: Optional[str]
+    license_number: Optional[str] = None
+    
+    @property
+    def dedup_key(self) -> str:
+        """Key identifying this license for duplicate detection."""
+        if self.license_number:
+            return self.license_number
+        return f"{self.name}|{self.application_date.isoformat()}"
     
     def format_announcement(self, config) -> str:
         """
@@ -25,67 +33,56 @@ class Restaurant:
         Returns:
             Formatted announcement string
         """
-        template = config.post_template
-        features = config.features
-        
-        # Start with header
-        parts = [template.get('header', "🆕 New Restaurant Alert!\n")]
+        prefixes = config.template_prefixes
         
-        # Add name
-        name_prefix = template.get('name_prefix', "🍽️") if features.use_emojis else ""
-        parts.append(f"{name_prefix} {self.name}")
-        
-        # Add address
-        addr_prefix = template.get('address_prefix', "📍") if features.use_emojis else ""
-        parts.append(f"{addr_prefix} {self.address}, Chicago IL {self.zip_code}")
+        # Start with header, name and address
+        parts = [
+            prefixes['header'],
+            f"{prefixes['name']} {self.name}",
+            f"{prefixes['address']} {self.address}, Chicago IL {self.zip_code}"
+        ]
         
         # Add business activity if enabled and available
-        if features.include_business_activity and self.business_activity:
-            activity_prefix = template.get('activity_prefix', "🍳") if features.use_emojis else ""
+        activity_prefix = prefixes['activity']
+        if activity_prefix is not None and self.business_activity:
             parts.append(f"{activity_prefix} {self.business_activity}")
             
         # Add square footage if enabled and available
-        if features.include_square_footage and self.square_footage:
-            sqft_prefix = template.get('square_footage_prefix', "📐") if features.use_emojis else ""
+        sqft_prefix = prefixes['square_footage']
+        if sqft_prefix is not None and self.square_footage:
             parts.append(f"{sqft_prefix} {self.square_footage} sq ft")
             
         # Add ward if enabled and available
-        if features.include_ward and self.ward:
-            ward_prefix = template.get('ward_prefix', "📍") if features.use_emojis else ""
+        ward_prefix = prefixes['ward']
+        if ward_prefix is not None and self.ward:
             parts.append(f"{ward_prefix} Located in Ward {self.ward}")
         
-        # Join parts with newlines
-        announcement = "\n".join(parts)
-        
-        # Add hashtags if enabled
-        if features.add_hashtags and config.hashtags:
-            announcement += "\n\n" + " ".join(f"#{tag}" for tag in config.hashtags)
-            
-        return announcement
+        # Join parts with newlines and append hashtags
+        return "\n".join(parts) + config.hashtag_suffix
     
-    def passes_filters(self, filters: Dict[str, list]) -> bool:
+    def passes_filters(self, filters: Dict[str, FrozenSet[str]]) -> bool:
         """
         Check if restaurant passes configured filters.
         
         Args:
-            filters: Dictionary of filter lists
+            filters: Dictionary of filter sets, as built in Config.filter_sets
             
         Returns:
             True if restaurant passes all filters, False otherwise
         """
-        # Check excluded license types
-        excluded_types = filters.get('excluded_license_types', [])
-        if excluded_types and self.license_description in excluded_types:
+        # Check included zip codes
+        included_zips = filters.get('included_zip_codes')
+        if included_zips and self.zip_code not in included_zips:
             return False
             
         # Check included wards
-        included_wards = filters.get('included_wards', [])
+        included_wards = filters.get('included_wards')
         if included_wards and self.ward not in included_wards:
             return False
             
-        # Check included zip codes
-        included_zips = filters.get('included_zip_codes', [])
-        if included_zips and self.zip_code not in included_zips:
+        # Check excluded license types
+        excluded_types = filters.get('excluded_license_types')
+        if excluded_types and self.license_description in excluded_types:
             return False
             
         return True
@@ -1,7 +1,9 @@
 import logging
+import threading
 import time
-from typing import Optional
-from atproto import Client
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+from atproto import Client, models
 from ..models.restaurant import Restaurant
 from ..config import Config
 
@@ -23,17 +25,25 @@ class BlueskyService:
         
         # Get throttling config
         features = config.features
-        throttling = self.config.yaml_config.get('features', {}).get('throttling', {})
+        throttling = config.throttling or {}
         self.throttling_enabled = throttling.get('enabled', True)
         self.min_delay = throttling.get('min_delay_between_posts', 2)
+        # applyWrites accepts at most 200 operations per call
+        self.max_batch_size = min(throttling.get('max_batch_size', 200), 200)
+        if self.max_batch_size < 1:
+            raise ValueError(
+                f"max_batch_size must be at least 1, got {self.max_batch_size}"
+            )
+        self.post_workers = max(1, throttling.get('post_workers', 4))
         
         # Get error handling config
-        error_handling = self.config.yaml_config.get('features', {}).get('error_handling', {})
+        error_handling = config.error_handling or {}
         self.auto_retry = features.auto_retry
         self.retry_delay = error_handling.get('retry_delay', 300)
         self.max_retries = error_handling.get('max_retries', 3)
         
-        self.last_post_time = 0
+        self.last_post_time = float('-inf')
+        self._rate_limit_lock = threading.Lock()
 
     def _login(self, handle: str, password: str) -> None:
         """
@@ -51,13 +61,21 @@ class BlueskyService:
             raise
 
     def _enforce_rate_limit(self):
-        """Enforce minimum delay between posts if throttling is enabled."""
-        if self.throttling_enabled:
-            elapsed = time.time() - self.last_post_time
-            if elapsed < self.min_delay:
-                sleep_time = self.min_delay - elapsed
-                self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
+        """
+        Enforce minimum delay between posts if throttling is enabled.
+        
+        The delay is measured between the starts of consecutive posts, so
+        the time spent waiting on the server counts towards it. Safe to
+        call from multiple threads.
+        """
+        with self._rate_limit_lock:
+            if self.throttling_enabled:
+                elapsed = time.monotonic() - self.last_post_time
+                if elapsed < self.min_delay:
+                    sleep_time = self.min_delay - elapsed
+                    self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+                    time.sleep(sleep_time)
+            self.last_post_time = time.monotonic()
 
     def post_restaurant(self, restaurant: Restaurant) -> bool:
         """
@@ -70,28 +88,149 @@ class BlueskyService:
             bool indicating if post was successful
         """
         # Check filters first
-        if not restaurant.passes_filters(self.config.filters):
+        if not restaurant.passes_filters(self.config.filter_sets):
             self.logger.info(
                 f"Skipping {restaurant.name} - did not pass filters"
             )
             return False
             
+        return self._send_post(restaurant)
+
+    def post_restaurants(
+        self,
+        restaurants: List[Restaurant]
+    ) -> Tuple[List[Restaurant], List[Restaurant]]:
+        """
+        Post restaurant announcements to Bluesky in batches.
+        
+        Each batch is created with a single applyWrites call, which is
+        applied atomically, so a batch either fully succeeds or fails.
+        Batches are sent from a small thread pool so their network latency
+        overlaps; throttling applies per batch rather than per post. If a
+        batch fails, its restaurants are posted one at a time so a single
+        bad record does not hold back the rest.
+        
+        Args:
+            restaurants: Restaurant objects to post about
+            
+        Returns:
+            Tuple of the restaurants that were posted and the restaurants
+            whose post failed; restaurants skipped by filters are in neither
+        """
+        # Check filters first
+        to_post = []
+        for restaurant in restaurants:
+            if restaurant.passes_filters(self.config.filter_sets):
+                to_post.append(restaurant)
+            else:
+                self.logger.info(
+                    f"Skipping {restaurant.name} - did not pass filters"
+                )
+        
+        batches = [
+            to_post[start:start + self.max_batch_size]
+            for start in range(0, len(to_post), self.max_batch_size)
+        ]
+        if not batches:
+            return [], []
+        
+        def send_batch(
+            batch: List[Restaurant]
+        ) -> Tuple[List[Restaurant], List[Restaurant]]:
+            try:
+                self._enforce_rate_limit()
+                self._apply_writes(batch)
+                self.logger.info(
+                    f"Successfully posted batch of {len(batch)} announcements"
+                )
+                return batch, []
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to post batch of {len(batch)} announcements, "
+                    f"posting them one at a time: {e}"
+                )
+            
+            batch_posted, batch_failed = [], []
+            for restaurant in batch:
+                if self._send_post(restaurant):
+                    batch_posted.append(restaurant)
+                else:
+                    batch_failed.append(restaurant)
+            return batch_posted, batch_failed
+        
+        workers = min(self.post_workers, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(send_batch, batches))
+        
+        posted, failed = [], []
+        for batch_posted, batch_failed in results:
+            posted.extend(batch_posted)
+            failed.extend(batch_failed)
+        return posted, failed
+
+    def _send_post(self, restaurant: Restaurant) -> bool:
+        """
+        Post a single announcement with send_post, retrying if enabled.
+        
+        Args:
+            restaurant: Restaurant object to post about
+            
+        Returns:
+            bool indicating if post was successful
+        """
+        announcement = restaurant.format_announcement(self.config)
+        return self._send_with_retries(
+            lambda: self.client.send_post(text=announcement),
+            f"announcement for {restaurant.name}"
+        )
+
+    def _apply_writes(self, restaurants: List[Restaurant]) -> None:
+        """
+        Create one post per restaurant in a single applyWrites call.
+        
+        Args:
+            restaurants: Restaurant objects to post about
+        """
+        # Build the same record send_post would, timestamping each post
+        # separately so the feed keeps the batch order
+        writes = [
+            models.ComAtprotoRepoApplyWrites.Create(
+                collection='app.bsky.feed.post',
+                value=models.AppBskyFeedPost.Record(
+                    text=restaurant.format_announcement(self.config),
+                    created_at=self.client.get_current_time_iso(),
+                    langs=['en']
+                )
+            )
+            for restaurant in restaurants
+        ]
+        self.client.com.atproto.repo.apply_writes(
+            models.ComAtprotoRepoApplyWrites.Data(
+                repo=self.client.me.did,
+                writes=writes
+            )
+        )
+
+    def _send_with_retries(self, send: Callable[[], None], description: str) -> bool:
+        """
+        Send a request to Bluesky, retrying on failure if enabled.
+        
+        Args:
+            send: Callable performing the request
+            description: What is being posted, for log messages
+            
+        Returns:
+            bool indicating if the request was successful
+        """
         retries = 0
         while retries <= self.max_retries:
             try:
                 # Enforce rate limiting
                 self._enforce_rate_limit()
                 
-                # Format and post announcement
-                announcement = restaurant.format_announcement(self.config)
-                self.client.send_post(text=announcement)
+                send()
                 
-                # Update last post time
-                self.last_post_time = time.time()
-                
-                self.logger.info(
-                    f"Successfully posted announcement for {restaurant.name}"
-                )
+                self.logger.info(f"Successfully posted {description}")
                 return True
                 
             except Exception as e:
@@ -1,79 +1,248 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import List, Optional
+from urllib.parse import urljoin
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 import logging
 from ..models.restaurant import Restaurant
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ChicagoDataService:
     """Service for interacting with the Chicago Data Portal API."""
     
-    def __init__(self, app_token: Optional[str] = None):
+    def __init__(
+        self,
+        app_token: Optional[str] = None,
+        page_size: int = 1000,
+        filters: Optional[Dict[str, Iterable[str]]] = None
+    ):
+        """
+        Initialize Chicago Data Portal service.
+        
+        Args:
+            app_token: Optional Socrata app token
+            page_size: Number of rows to request per page
+            filters: Optional filter lists to apply server-side
+        """
         self.base_url = "https://data.cityofchicago.org/resource/"
         self.app_token = app_token
+        self.page_size = page_size
         self.logger = logging.getLogger(__name__)
+        
+        # The endpoint and the static part of the query never change
+        self._url = urljoin(self.base_url, "xqx5-8hwx.json")  # Business licenses endpoint
+        self._where_prefix = (
+            "license_description like '%RETAIL FOOD%' AND application_type='ISSUE'"
+            + self._build_filter_clause(filters or {})
+        )
+        
+        # Cache validators from the last response for conditional GETs
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.last_status_code: Optional[int] = None
+        
+        # Whether the last fetch read every page without an error
+        self.last_fetch_complete = False
+        
+        # Reuse one pooled session so polls keep the connection alive
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1.0,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self._session.mount('https://', adapter)
+        self._session.headers.update(self._build_headers())
 
     def _build_headers(self) -> dict:
         """Build request headers including app token if available."""
         headers = {
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate'
         }
         if self.app_token:
             headers["X-App-Token"] = self.app_token
         return headers
 
+    @staticmethod
+    def _build_filter_clause(filters: Dict[str, Iterable[str]]) -> str:
+        """
+        Translate configured filters into SoQL conditions.
+        
+        Args:
+            filters: Dictionary of filter lists
+            
+        Returns:
+            SoQL fragment to append to the $where clause, or an empty string
+        """
+        def quoted(values: Iterable[str]) -> str:
+            return ",".join(
+                "'" + str(v).replace("'", "''") + "'" for v in sorted(values, key=str)
+            )
+        
+        clauses = []
+        for key, column, operator in (
+            ('included_zip_codes', 'zip_code', 'IN'),
+            ('included_wards', 'ward', 'IN'),
+            ('excluded_license_types', 'license_description', 'NOT IN'),
+        ):
+            values = filters.get(key)
+            if values:
+                clauses.append(f" AND {column} {operator} ({quoted(values)})")
+        return "".join(clauses)
+
+    def _build_conditional_headers(self) -> Dict[str, str]:
+        """Build conditional request headers from cached validators."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
     def get_new_restaurants(self, since: datetime) -> List[Restaurant]:
         """
         Fetch newly licensed restaurants from Chicago Data Portal.
         
         Args:
-            since: datetime to fetch restaurants after
+            since: datetime whose date is the earliest to fetch, inclusive
             
         Returns:
-            List of Restaurant objects
+            List of Restaurant objects, empty if the data is unchanged
+        """
+        return list(self.iter_new_restaurants(since))
+
+    def iter_new_restaurants(
+        self,
+        since: datetime,
+        inclusive: bool = True
+    ) -> Iterator[Restaurant]:
+        """
+        Stream newly licensed restaurants from Chicago Data Portal.
+        
+        Results are fetched one page at a time, so the next page is only
+        requested once the caller has consumed the current one. If a page
+        fails, iteration stops and last_fetch_complete stays False.
+        
+        Args:
+            since: datetime whose date is the earliest to fetch
+            inclusive: Whether to include applications created on that date
+            
+        Yields:
+            Restaurant objects, none if the data is unchanged
         """
-        endpoint = "xqx5-8hwx.json"  # Business licenses endpoint
+        operator = ">=" if inclusive else ">"
         
         # Use the correct column names from the API
         params = {
-            "$select": "legal_name,address,zip_code,license_description,business_activity,square_footage,application_type,application_created_date,ward",
-            "$where": f"license_description like '%RETAIL FOOD%' AND application_type='ISSUE' AND application_created_date > '{since.strftime('%Y-%m-%d')}'",
-            "$order": "application_created_date DESC",
-            "$limit": "10"  # Limit to 10 results for testing
+            "$select": "license_number,legal_name,address,zip_code,license_description,business_activity,square_footage,application_created_date,ward",
+            "$where": f"{self._where_prefix} AND application_created_date {operator} '{since.strftime('%Y-%m-%d')}'",
+            # Order by :id as well so pages are stable
+            "$order": "application_created_date DESC, :id",
+            "$limit": str(self.page_size)
         }
         
+        fromiso = datetime.fromisoformat
+        self.last_status_code = None
+        self.last_fetch_complete = False
+        offset = 0
+        while True:
+            params["$offset"] = str(offset)
+            data = self._fetch_page(
+                self._url,
+                params,
+                conditional=(offset == 0)
+            )
+            if data is None:
+                return
+            
+            for r in data:
+                yield Restaurant(
+                    name=r.get('legal_name'),
+                    address=r.get('address'),
+                    zip_code=r.get('zip_code'),
+                    license_description=r.get('license_description'),
+                    business_activity=r.get('business_activity'),
+                    square_footage=r.get('square_footage'),
+                    application_date=fromiso(r.get('application_created_date')),
+                    ward=r.get('ward'),
+                    license_number=r.get('license_number')
+                )
+            
+            if len(data) < self.page_size:
+                self.last_fetch_complete = True
+                return
+            offset += self.page_size
+
+    def _fetch_page(
+        self,
+        url: str,
+        params: Dict[str, str],
+        conditional: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch a single page of results.
+        
+        Args:
+            url: Endpoint URL
+            params: SoQL query parameters
+            conditional: Whether to send cached validators with the request
+            
+        Returns:
+            List of raw result rows, empty if unchanged, or None on error
+        """
         try:
-            response = requests.get(
-                f"{self.base_url}{endpoint}",
-                headers=self._build_headers(),
-                params=params
+            response = self._session.get(
+                url,
+                params=params,
+                headers=self._build_conditional_headers() if conditional else None,
+                timeout=(5, 30)
             )
             
             # Log the actual URL being requested
             self.logger.info(f"Requesting URL: {response.url}")
             
+            if conditional:
+                self.last_status_code = response.status_code
+                if response.status_code == 304:
+                    self.logger.info("Data unchanged since last check")
+                    return []
+            
             response.raise_for_status()
-            data = response.json()
+            
+            data = (
+                orjson.loads(response.content) if ORJSON_AVAILABLE
+                else response.json()
+            )
+            
+            # Remember validators for the next conditional request, only
+            # once the body has decoded
+            if conditional:
+                self.etag = response.headers.get('ETag')
+                self.last_modified = response.headers.get('Last-Modified')
             
             # Log the number of results
             self.logger.info(f"Found {len(data)} results")
             
-            return [
-                Restaurant(
-                    name=r.get('legal_name'),  # Changed from business_name to legal_name
-                    address=r.get('address'),
-                    zip_code=r.get('zip_code'),
-                    license_description=r.get('license_description'),
-                    business_activity=r.get('business_activity'),
-                    square_footage=r.get('square_footage'),
-                    application_date=datetime.fromisoformat(r.get('application_created_date')),
-                    ward=r.get('ward')
-                )
-                for r in data
-            ]
+            return data
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error fetching data from Chicago Data Portal: {e}")
             if hasattr(e, 'response') and hasattr(e.response, 'text'):
                 self.logger.error(f"Response content: {e.response.text}")
-            return []
+            return None
+        except ValueError as e:
+            # orjson.JSONDecodeError is a ValueError, not a RequestException
+            self.logger.error(f"Error decoding data from Chicago Data Portal: {e}")
+            return None
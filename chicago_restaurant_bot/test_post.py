@@ -1,45 +1,57 @@
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import TYPE_CHECKING
 from .models.restaurant import Restaurant
-from .services.chicago_data_service import ChicagoDataService
-from .config import Config
-import yaml
-import os
-from dotenv import load_dotenv
+import sys
 
-def preview_restaurant(restaurant: Restaurant, config: Config):
-    """Display a preview for a single restaurant."""
-    print("\nRestaurant Details:")
-    print("-" * 50)
-    print(f"Name: {restaurant.name}")
-    print(f"Address: {restaurant.address}")
-    print(f"ZIP: {restaurant.zip_code}")
-    print(f"License: {restaurant.license_description}")
-    print(f"Activity: {restaurant.business_activity}")
-    print(f"Size: {restaurant.square_footage} sq ft")
-    print(f"Ward: {restaurant.ward}")
-    print(f"Application Date: {restaurant.application_date}")
-    print("\nFormatted Post Preview:")
-    print("-" * 50)
+if TYPE_CHECKING:
+    from .config import Config
+
+def preview_restaurant(restaurant: Restaurant, config: "Config", passed: bool) -> None:
+    """
+    Display a preview for a single restaurant.
     
-    # Show formatted announcement
-    announcement = restaurant.format_announcement(config)
-    print(announcement)
+    The preview is assembled first and written to stdout in one call.
     
-    # Show character count (useful for platform limits)
-    print("\nCharacter Count:", len(announcement))
+    Args:
+        restaurant: Restaurant to preview
+        config: Config object used to format the announcement
+        passed: Whether the restaurant passes the configured filters
+    """
+    divider = "-" * 50
+    announcement = restaurant.format_announcement(config)
     
-    # Show if post would pass filters
-    if restaurant.passes_filters(config.filters):
-        print("Status: Would be posted ✅")
-    else:
-        print("Status: Would be filtered out ❌")
-    print("-" * 50)
+    parts = [
+        "\nRestaurant Details:",
+        divider,
+        f"Name: {restaurant.name}",
+        f"Address: {restaurant.address}",
+        f"ZIP: {restaurant.zip_code}",
+        f"License: {restaurant.license_description}",
+        f"Activity: {restaurant.business_activity}",
+        f"Size: {restaurant.square_footage} sq ft",
+        f"Ward: {restaurant.ward}",
+        f"Application Date: {restaurant.application_date}",
+        "\nFormatted Post Preview:",
+        divider,
+        announcement,
+        # Show character count (useful for platform limits)
+        f"\nCharacter Count: {len(announcement)}",
+        # Show if post would pass filters
+        "Status: Would be posted ✅" if passed else "Status: Would be filtered out ❌",
+        divider,
+    ]
+    sys.stdout.write("\n".join(parts) + "\n")
 
 def main():
     """
     Test the post formatting with real restaurant data from the API.
     Loads actual config but doesn't post to Bluesky.
     """
+    # Import heavy dependencies only when the preview actually runs
+    from dotenv import load_dotenv
+    from .config import Config
+    from .services.chicago_data_service import ChicagoDataService
+    
     # Load environment variables
     load_dotenv()
     
@@ -48,6 +60,7 @@ def main():
     try:
         # Load config
         config = Config.from_env()
+        filters = config.filter_sets
         
         # Initialize Chicago Data Service
         chicago_data = ChicagoDataService(config.chicago_data_token)
@@ -64,14 +77,18 @@ def main():
             
         print(f"\nFound {len(restaurants)} new restaurants!")
             
+        # Evaluate filters once per restaurant
+        results = [(r, r.passes_filters(filters)) for r in restaurants]
+            
         # Preview each restaurant
-        for i, restaurant in enumerate(restaurants, 1):
-            print(f"\n=== Restaurant {i}/{len(restaurants)} ===")
-            preview_restaurant(restaurant, config)
+        for i, (restaurant, passed) in enumerate(results, 1):
+            print(f"\n=== Restaurant {i}/{len(results)} ===")
+            preview_restaurant(restaurant, config, passed)
             
         # Summary
-        would_post = sum(1 for r in restaurants if r.passes_filters(config.filters))
+        would_post = sum(1 for _, passed in results if passed)
         print(f"\nSummary: {would_post}/{len(restaurants)} restaurants would be posted")
+        sys.stdout.flush()
             
     except Exception as e:
         print(f"\nError: {e}")
@@ -1,31 +1,81 @@
+import atexit
 import logging
-from typing import Optional
+import logging.handlers
+import queue
+from typing import List, Optional
+
+# Set by setup_logging so flush_logs can reach the listener's handlers
+_log_queue: Optional[queue.Queue] = None
+_buffered_handlers: List[logging.handlers.MemoryHandler] = []
 
 
 def setup_logging(level: int = logging.INFO, log_file: Optional[str] = None) -> None:
     """
     Configure logging for the application.
     
+    Records are put on a queue by the calling thread and written to the
+    console and log file by a background listener thread. Repeated calls
+    only update the level.
+    
     Args:
         level: Logging level (default: INFO)
         log_file: Optional file path to write logs to
     """
+    # Configure root logger
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+
+    # Skip if logging has already been set up
+    if any(
+        isinstance(h, logging.handlers.QueueHandler)
+        for h in root_logger.handlers
+    ):
+        return
+
     # Create formatter
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(level)
-
     # Always add console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
-    # Optionally add file handler
+    # Optionally add file handler, buffering records until a warning
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+            flushOnClose=True
+        )
+        handlers.append(buffered_handler)
+        _buffered_handlers.append(buffered_handler)
+        # Registered first so it runs after the listener has drained
+        atexit.register(buffered_handler.close)
+
+    # Hand records to a background thread that does the actual writes
+    global _log_queue
+    log_queue = _log_queue = queue.Queue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+
+def flush_logs() -> None:
+    """
+    Write out buffered file log records.
+    
+    Waits for the listener to handle every queued record first, so
+    everything logged before the call reaches the log file.
+    """
+    if _log_queue is not None:
+        _log_queue.join()
+    for handler in _buffered_handlers:
+        handler.flush()
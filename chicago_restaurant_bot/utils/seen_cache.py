@@ -0,0 +1,72 @@
+import json
+import logging
+import os
+from collections import OrderedDict
+
+
+class SeenLicenseCache:
+    """Bounded LRU of recently posted license keys, persisted to JSON."""
+    
+    def __init__(self, cache_file: str, max_entries: int = 5000):
+        """
+        Initialize SeenLicenseCache.
+        
+        Args:
+            cache_file: Path to file for storing seen keys
+            max_entries: Maximum number of keys to remember
+        """
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(__name__)
+        self._keys: "OrderedDict[str, None]" = OrderedDict()
+        # Whether the cache file exists, i.e. it covers earlier posts
+        self.persisted = False
+        self._load()
+    
+    def _load(self) -> None:
+        """Load seen keys from file, oldest first."""
+        try:
+            with open(self.cache_file, "r") as f:
+                keys = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.logger.error(f"Error loading seen licenses: {e}")
+            return
+        
+        self.persisted = True
+        for key in keys[-self.max_entries:]:
+            self._keys[key] = None
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+    
+    def add(self, key: str) -> None:
+        """
+        Mark a key as seen, evicting the oldest key if the cache is full.
+        
+        Args:
+            key: License key to remember
+        """
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        if len(self._keys) > self.max_entries:
+            self._keys.popitem(last=False)
+    
+    def save(self) -> None:
+        """
+        Save seen keys to file.
+        
+        Keys are written to a temporary file, synced and renamed over the
+        old file, so a crash never leaves a truncated cache behind.
+        """
+        tmp_file = f"{self.cache_file}.tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(list(self._keys), f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.cache_file)
+            self.persisted = True
+        except Exception as e:
+            self.logger.error(f"Error saving seen licenses: {e}")
@@ -1,8 +1,34 @@
 import os
+import json
+import struct
 from datetime import datetime
+from typing import Dict, Optional
 import logging
 
 
+_LOGGER = logging.getLogger(__name__)
+
+# Timestamps are stored as a little-endian float64 epoch
+_TIMESTAMP_FORMAT = struct.Struct('<d')
+
+
+def _pread(fd: int, size: int) -> bytes:
+    """Read from the start of a file, without pread on platforms lacking it."""
+    if hasattr(os, 'pread'):
+        return os.pread(fd, size, 0)
+    os.lseek(fd, 0, os.SEEK_SET)
+    return os.read(fd, size)
+
+
+def _pwrite(fd: int, data: bytes) -> None:
+    """Write at the start of a file, without pwrite on platforms lacking it."""
+    if hasattr(os, 'pwrite'):
+        os.pwrite(fd, data, 0)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, data)
+
+
 class TimestampManager:
     """Manages persistence of the last check timestamp."""
     
@@ -14,12 +40,58 @@ class TimestampManager:
             timestamp_file: Path to file for storing timestamp
         """
         self.timestamp_file = timestamp_file
-        self.logger = logging.getLogger(__name__)
+        self.validators_file = f"{timestamp_file}.validators"
+        
+        # Convert an ISO-8601 file from older versions before opening it
+        self._migrate_legacy_file()
+        
+        # Keep the file open so loads and saves skip open/close entirely
+        self._fd = os.open(self.timestamp_file, os.O_RDWR | os.O_CREAT, 0o644)
         
-        # Create timestamp file if it doesn't exist
-        if not os.path.exists(self.timestamp_file):
+        # Initialize a newly created file
+        if os.fstat(self._fd).st_size == 0:
             self.save_timestamp(datetime.now())
 
+    def _migrate_legacy_file(self) -> None:
+        """
+        Rewrite a legacy ISO-8601 timestamp file in the binary format.
+        
+        The new contents are written to a temporary file, synced and renamed
+        over the old one, so a crash leaves either the old or the new file.
+        
+        Raises:
+            ValueError: If the legacy file does not hold a valid timestamp
+        """
+        try:
+            size = os.stat(self.timestamp_file).st_size
+        except FileNotFoundError:
+            return
+        if size in (0, _TIMESTAMP_FORMAT.size):
+            return
+        
+        with open(self.timestamp_file, "r") as f:
+            timestamp = datetime.fromisoformat(f.read().strip())
+        
+        tmp_file = f"{self.timestamp_file}.tmp"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, _TIMESTAMP_FORMAT.pack(timestamp.timestamp()))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, self.timestamp_file)
+        _LOGGER.info(f"Migrated {self.timestamp_file} to the binary format")
+
+    def close(self) -> None:
+        """Close the timestamp file."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        if getattr(self, '_fd', None) is not None:
+            self.close()
+
     def load_timestamp(self) -> datetime:
         """
         Load the last check timestamp from file.
@@ -28,11 +100,10 @@ class TimestampManager:
             datetime object of last check
         """
         try:
-            with open(self.timestamp_file, "r") as f:
-                timestamp_str = f.read().strip()
-                return datetime.fromisoformat(timestamp_str)
+            data = _pread(self._fd, _TIMESTAMP_FORMAT.size)
+            return datetime.fromtimestamp(_TIMESTAMP_FORMAT.unpack(data)[0])
         except Exception as e:
-            self.logger.error(f"Error loading timestamp: {e}")
+            _LOGGER.error(f"Error loading timestamp: {e}")
             # Return current time if there's an error
             return datetime.now()
 
@@ -40,11 +111,53 @@ class TimestampManager:
         """
         Save a timestamp to file.
         
+        The fixed-width record is overwritten in place and synced to disk.
+        An 8-byte write at offset 0 never spans a disk sector, so a crash
+        leaves either the old or the new value, never a truncated file.
+        
         Args:
             timestamp: datetime to save
+            
+        Raises:
+            OSError: If the timestamp could not be written
+        """
+        _pwrite(self._fd, _TIMESTAMP_FORMAT.pack(timestamp.timestamp()))
+        os.fsync(self._fd)
+
+    def load_validators(self) -> Dict[str, Optional[str]]:
+        """
+        Load the HTTP cache validators saved by the last fetch.
+        
+        Returns:
+            Dictionary with 'etag' and 'last_modified' keys
+        """
+        try:
+            with open(self.validators_file, "r") as f:
+                validators = json.load(f)
+        except FileNotFoundError:
+            validators = {}
+        except Exception as e:
+            _LOGGER.error(f"Error loading validators: {e}")
+            validators = {}
+        return {
+            'etag': validators.get('etag'),
+            'last_modified': validators.get('last_modified')
+        }
+
+    def save_validators(
+        self,
+        etag: Optional[str],
+        last_modified: Optional[str]
+    ) -> None:
+        """
+        Save HTTP cache validators to file.
+        
+        Args:
+            etag: ETag header from the last response
+            last_modified: Last-Modified header from the last response
         """
         try:
-            with open(self.timestamp_file, "w") as f:
-                f.write(timestamp.isoformat())
+            with open(self.validators_file, "w") as f:
+                json.dump({'etag': etag, 'last_modified': last_modified}, f)
         except Exception as e:
-            self.logger.error(f"Error saving timestamp: {e}")
+            _LOGGER.error(f"Error saving validators: {e}")